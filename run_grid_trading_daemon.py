@@ -25,70 +25,169 @@
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 """
 
-from core.adapters.exchanges.utils import setup_optimized_logging
-from core.adapters.exchanges.models import ExchangeType
-from core.adapters.exchanges import ExchangeFactory, ExchangeConfig
-from core.services.grid.coordinator import GridCoordinator
-from core.services.grid.implementations import (
-    GridStrategyImpl,
-    GridEngineImpl,
-    PositionTrackerImpl
-)
-from core.services.grid.models import GridConfig, GridType, GridState
-from core.services.grid.reserve import (
-    SpotReserveManager,
-    ReserveMonitor,
-    check_spot_reserve_on_startup
-)
-from core.logging import get_system_logger
+from __future__ import annotations
+
+# 注意：core.* 模块在使用处延迟导入，使 --help / --version / 配置路径错误等
+# 提前退出的场景无需加载交易所 SDK 与网格系统
 import sys
 import asyncio
 import yaml
 from pathlib import Path
 from decimal import Decimal
 import argparse
+import functools
 import logging
 import signal
 import os
-from datetime import datetime
+import time
+
+# 优先使用 libyaml C 解析器（与 SafeLoader 语义一致，解析速度更快）
+try:
+    from yaml import CSafeLoader as _SafeLoader
+    _YAML_C_LOADER = True
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+    _YAML_C_LOADER = False
+
+# JSON 配置优先使用 orjson（可选依赖），否则回退到标准库 json
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+
+def _to_decimal(x) -> Decimal:
+    """转换为 Decimal（仅 float 经 str 中转，避免二进制浮点精度误差）"""
+    if isinstance(x, Decimal):
+        return x
+    if isinstance(x, (int, str)):
+        return Decimal(x)
+    return Decimal(str(x))
+
+
+# create_grid_config 的可选参数表: (字段名, 转换函数)，转换函数为 None 时原样复制
+_MISSING = object()
+_OPTIONAL_GRID_FIELDS = (
+    # 马丁网格参数
+    ('martingale_increment', _to_decimal),
+    # 剥头皮模式参数
+    ('scalping_enabled', None),
+    ('scalping_trigger_percent', None),
+    ('scalping_take_profit_grids', None),
+    # 智能剥头皮模式参数
+    ('smart_scalping_enabled', None),
+    ('allowed_deep_drops', None),
+    ('min_drop_threshold_percent', None),
+    # 本金保护模式参数
+    ('capital_protection_enabled', None),
+    ('capital_protection_trigger_percent', None),
+    # 止盈模式参数
+    ('take_profit_enabled', None),
+    ('take_profit_percentage', _to_decimal),
+    # 价格锁定模式参数
+    ('price_lock_enabled', None),
+    ('price_lock_threshold', _to_decimal),
+    ('price_lock_start_at_threshold', None),
+    # 反手挂单参数
+    ('reverse_order_grid_distance', int),
+    # 止损保护模式参数
+    ('stop_loss_protection_enabled', None),
+    ('stop_loss_trigger_percent', _to_decimal),
+    ('stop_loss_escape_timeout', int),
+    ('stop_loss_apr_threshold', _to_decimal),
+    # 退出清理模式参数
+    ('exit_cleanup_enabled', None),
+    # 保证金模式参数
+    ('margin_mode', str),
+    # 杠杆倍数参数
+    ('leverage', int),
+    # 现货预留管理配置
+    ('spot_reserve', None),
+    # 健康检查容错配置
+    ('position_tolerance', None),
+    # 健康检查快照次数配置
+    ('health_check_snapshot_count', int),
+)
+
 
-# 添加项目根目录到路径
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+# 市场类型检测使用的交易对标记
+_HL_PERP_SUFFIXES = (":USDC", ":PERP")
+_BP_PERP_TOKENS = ("_PERP", "PERP")
+_BP_SPOT_TOKENS = ("_SPOT", "SPOT")
+
+
+# 配置解析缓存：键为 (解析后的路径, mtime_ns)，同一文件每个进程只解析一次
+_config_cache: dict[tuple[str, int], dict] = {}
+
+
+def _load_config_cached(path: Path) -> dict:
+    """读取并缓存配置文件（.json 走 JSON 解析，其余按 YAML；文件修改后自动失效）"""
+    path = Path(path).resolve()
+    key = (str(path), path.stat().st_mtime_ns)
+    data = _config_cache.get(key)
+    if data is None:
+        if path.suffix.lower() == '.json':
+            data = _json_loads(path.read_bytes())
+        else:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = yaml.load(f, Loader=_SafeLoader)
+        _config_cache[key] = data
+    return data
 
 
 class DaemonGridRunner:
     """后台运行的网格交易管理器"""
 
+    # 日志分隔线
+    _SEP = "=" * 80
+
     def __init__(self, config_path: str, debug: bool = False):
+        from core.logging import get_system_logger
+
         self.config_path = config_path
         self.debug = debug
         self.logger = get_system_logger()
         
-        # 运行状态
-        self._running = False
-        self._shutdown_event = asyncio.Event()
+        # 运行状态（退出事件是唯一的停止信号，在 run() 中随事件循环创建）
+        self._shutdown_event = None
+        self._loop = None
         
         # 核心组件
         self.coordinator = None
         self.exchange_adapter = None
         self.reserve_monitor = None
+
+        # 交易所凭证缓存 (api_key, api_secret, wallet_address, api_config)
+        self._exchange_secrets = None
+
+        # 交易对/交易所名称（加载配置后统一大小写）
+        self._symbol_upper = None
+        self._exchange_lower = None
         
         # 统计信息刷新间隔（秒）
         self.stats_interval = 300  # 每5分钟输出一次统计
         
+    def _log_banner(self, *lines: str):
+        """以分隔线包裹多行文本，作为一条日志记录输出"""
+        self.logger.info("\n".join((self._SEP, *lines, self._SEP)))
+
     async def load_config(self) -> dict:
         """加载配置文件"""
+        if not _YAML_C_LOADER and Path(self.config_path).suffix.lower() != '.json':
+            self.logger.warning(
+                "⚠️ 未检测到 libyaml，YAML 使用纯 Python 解析器"
+                "（建议安装 libyaml-dev 后重新安装 PyYAML）"
+            )
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
-            return config
+            return _load_config_cached(Path(self.config_path))
         except Exception as e:
             self.logger.error(f"❌ 加载配置文件失败: {e}")
             raise
 
     def create_grid_config(self, config_data: dict) -> GridConfig:
         """创建网格配置对象（复用原脚本的逻辑）"""
+        from core.services.grid.models import GridConfig, GridType
+
         grid_config = config_data['grid_system']
         grid_type = GridType(grid_config['grid_type'])
 
@@ -97,14 +196,14 @@ class DaemonGridRunner:
             'exchange': grid_config['exchange'],
             'symbol': grid_config['symbol'],
             'grid_type': grid_type,
-            'grid_interval': Decimal(str(grid_config['grid_interval'])),
-            'order_amount': Decimal(str(grid_config['order_amount'])),
-            'max_position': Decimal(str(grid_config.get('max_position'))) if grid_config.get('max_position') else None,
+            'grid_interval': _to_decimal(grid_config['grid_interval']),
+            'order_amount': _to_decimal(grid_config['order_amount']),
+            'max_position': _to_decimal(grid_config.get('max_position')) if grid_config.get('max_position') else None,
             'enable_notifications': grid_config.get('enable_notifications', False),
             'order_health_check_enabled': grid_config.get('order_health_check_enabled', True),
             'order_health_check_interval': grid_config.get('order_health_check_interval', 600),
             'rest_position_query_interval': grid_config.get('rest_position_query_interval', 1),
-            'fee_rate': Decimal(str(grid_config.get('fee_rate', '0.0001'))),
+            'fee_rate': _to_decimal(grid_config.get('fee_rate', '0.0001')),
             'quantity_precision': int(grid_config.get('quantity_precision', 3)),
             'price_decimals': int(grid_config.get('price_decimals', 2)),
         }
@@ -116,210 +215,122 @@ class DaemonGridRunner:
             params['follow_distance'] = grid_config.get('follow_distance', 1)
             params['price_offset_grids'] = grid_config.get('price_offset_grids', 0)
         else:
-            params['lower_price'] = Decimal(str(grid_config['price_range']['lower_price']))
-            params['upper_price'] = Decimal(str(grid_config['price_range']['upper_price']))
-
-        # 马丁网格参数
-        if 'martingale_increment' in grid_config:
-            params['martingale_increment'] = Decimal(str(grid_config['martingale_increment']))
-
-        # 剥头皮模式参数
-        if 'scalping_enabled' in grid_config:
-            params['scalping_enabled'] = grid_config['scalping_enabled']
-        if 'scalping_trigger_percent' in grid_config:
-            params['scalping_trigger_percent'] = grid_config['scalping_trigger_percent']
-        if 'scalping_take_profit_grids' in grid_config:
-            params['scalping_take_profit_grids'] = grid_config['scalping_take_profit_grids']
-
-        # 智能剥头皮模式参数
-        if 'smart_scalping_enabled' in grid_config:
-            params['smart_scalping_enabled'] = grid_config['smart_scalping_enabled']
-        if 'allowed_deep_drops' in grid_config:
-            params['allowed_deep_drops'] = grid_config['allowed_deep_drops']
-        if 'min_drop_threshold_percent' in grid_config:
-            params['min_drop_threshold_percent'] = grid_config['min_drop_threshold_percent']
-
-        # 本金保护模式参数
-        if 'capital_protection_enabled' in grid_config:
-            params['capital_protection_enabled'] = grid_config['capital_protection_enabled']
-        if 'capital_protection_trigger_percent' in grid_config:
-            params['capital_protection_trigger_percent'] = grid_config['capital_protection_trigger_percent']
-
-        # 止盈模式参数
-        if 'take_profit_enabled' in grid_config:
-            params['take_profit_enabled'] = grid_config['take_profit_enabled']
-        if 'take_profit_percentage' in grid_config:
-            params['take_profit_percentage'] = Decimal(str(grid_config['take_profit_percentage']))
-
-        # 价格锁定模式参数
-        if 'price_lock_enabled' in grid_config:
-            params['price_lock_enabled'] = grid_config['price_lock_enabled']
-        if 'price_lock_threshold' in grid_config:
-            params['price_lock_threshold'] = Decimal(str(grid_config['price_lock_threshold']))
-        if 'price_lock_start_at_threshold' in grid_config:
-            params['price_lock_start_at_threshold'] = grid_config['price_lock_start_at_threshold']
-
-        # 反手挂单参数
-        if 'reverse_order_grid_distance' in grid_config:
-            params['reverse_order_grid_distance'] = int(grid_config['reverse_order_grid_distance'])
-
-        # 止损保护模式参数
-        if 'stop_loss_protection_enabled' in grid_config:
-            params['stop_loss_protection_enabled'] = grid_config['stop_loss_protection_enabled']
-        if 'stop_loss_trigger_percent' in grid_config:
-            params['stop_loss_trigger_percent'] = Decimal(str(grid_config['stop_loss_trigger_percent']))
-        if 'stop_loss_escape_timeout' in grid_config:
-            params['stop_loss_escape_timeout'] = int(grid_config['stop_loss_escape_timeout'])
-        if 'stop_loss_apr_threshold' in grid_config:
-            params['stop_loss_apr_threshold'] = Decimal(str(grid_config['stop_loss_apr_threshold']))
-
-        # 退出清理模式参数
-        if 'exit_cleanup_enabled' in grid_config:
-            params['exit_cleanup_enabled'] = grid_config['exit_cleanup_enabled']
-
-        # 保证金模式参数
-        if 'margin_mode' in grid_config:
-            params['margin_mode'] = str(grid_config['margin_mode'])
-
-        # 杠杆倍数参数
-        if 'leverage' in grid_config:
-            params['leverage'] = int(grid_config['leverage'])
-
-        # 现货预留管理配置
-        if 'spot_reserve' in grid_config:
-            params['spot_reserve'] = grid_config['spot_reserve']
-
-        # 健康检查容错配置
-        if 'position_tolerance' in grid_config:
-            params['position_tolerance'] = grid_config['position_tolerance']
-
-        # 健康检查快照次数配置
-        if 'health_check_snapshot_count' in grid_config:
-            params['health_check_snapshot_count'] = int(grid_config['health_check_snapshot_count'])
+            params['lower_price'] = _to_decimal(grid_config['price_range']['lower_price'])
+            params['upper_price'] = _to_decimal(grid_config['price_range']['upper_price'])
+
+        # 可选参数：仅复制配置中出现的字段
+        for key, conv in _OPTIONAL_GRID_FIELDS:
+            value = grid_config.get(key, _MISSING)
+            if value is not _MISSING:
+                params[key] = value if conv is None else conv(value)
 
         return GridConfig(**params)
 
-    def detect_market_type(self, symbol: str, exchange_name: str) -> ExchangeType:
-        """检测市场类型（复用原脚本的逻辑）"""
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def detect_market_type(symbol: str, exchange_name: str) -> ExchangeType:
+        """检测市场类型（复用原脚本的逻辑，结果按参数缓存）"""
+        from core.adapters.exchanges.models import ExchangeType
+
         symbol_upper = symbol.upper()
         exchange_lower = exchange_name.lower()
 
         if exchange_lower == "hyperliquid":
-            if ":USDC" in symbol_upper or ":PERP" in symbol_upper or ":SPOT" in symbol_upper:
-                if ":SPOT" in symbol_upper:
-                    return ExchangeType.SPOT
-                else:
-                    return ExchangeType.PERPETUAL
-            else:
+            if ":SPOT" in symbol_upper:
                 return ExchangeType.SPOT
+            if any(s in symbol_upper for s in _HL_PERP_SUFFIXES):
+                return ExchangeType.PERPETUAL
+            return ExchangeType.SPOT
         elif exchange_lower == "backpack":
-            if "_PERP" in symbol_upper or "PERP" in symbol_upper:
+            if any(s in symbol_upper for s in _BP_PERP_TOKENS):
                 return ExchangeType.PERPETUAL
-            elif "_SPOT" in symbol_upper or "SPOT" in symbol_upper:
+            elif any(s in symbol_upper for s in _BP_SPOT_TOKENS):
                 return ExchangeType.SPOT
             else:
                 return ExchangeType.PERPETUAL
-        elif exchange_lower == "lighter":
-            return ExchangeType.PERPETUAL
         else:
+            # lighter 及其他交易所默认永续合约
             return ExchangeType.PERPETUAL
 
-    async def create_exchange_adapter(self, config_data: dict):
-        """创建交易所适配器（复用原脚本的逻辑）"""
-        grid_config = config_data['grid_system']
-        exchange_name = grid_config['exchange'].lower()
-        symbol = grid_config['symbol']
-        market_type = self.detect_market_type(symbol, exchange_name)
-
-        self.logger.info(f"市场类型: {market_type.value}")
+    def _resolve_credentials(self, exchange_name: str) -> tuple:
+        """
+        解析交易所凭证（环境变量优先，缺失时回退到交易所配置文件）
 
-        # 读取 API 密钥
-        api_key = os.getenv(f"{exchange_name.upper()}_API_KEY")
-        api_secret = os.getenv(f"{exchange_name.upper()}_API_SECRET")
-        wallet_address = os.getenv(f"{exchange_name.upper()}_WALLET_ADDRESS")
+        Args:
+            exchange_name: 交易所名称（小写）
 
-        if not api_key or not api_secret:
+        Returns:
+            (api_key, api_secret, wallet_address, api_config)，
+            api_config 为配置文件中的 api_config 段（未读取时为空字典）
+        """
+        env_prefix = exchange_name.upper()
+        api_key = os.environ.get(f"{env_prefix}_API_KEY")
+        api_secret = os.environ.get(f"{env_prefix}_API_SECRET")
+        wallet_address = os.environ.get(f"{env_prefix}_WALLET_ADDRESS")
+        api_config = {}
+
+        # Lighter 始终需要配置文件中的 api_config（testnet 等），其他交易所仅在缺少密钥时读取
+        if not api_key or not api_secret or exchange_name == "lighter":
             try:
                 exchange_config_path = Path(f"config/exchanges/{exchange_name}_config.yaml")
                 if exchange_config_path.exists():
-                    with open(exchange_config_path, 'r', encoding='utf-8') as f:
-                        exchange_config_data = yaml.safe_load(f)
-
-                    auth_config = exchange_config_data.get(exchange_name, {}).get('authentication', {})
-
-                    if exchange_name == "hyperliquid":
-                        api_key = api_key or auth_config.get('private_key', "")
-                        api_secret = api_secret or auth_config.get('private_key', "")
-                        wallet_address = wallet_address or auth_config.get('wallet_address', "")
-                    elif exchange_name == "lighter":
-                        api_config = exchange_config_data.get('api_config', {})
-                        auth_config = api_config.get('auth', {})
-                        api_key = api_key or auth_config.get('api_key_private_key', "")
-                        api_secret = api_secret or auth_config.get('api_key_private_key', "")
-                    else:
-                        api_key = api_key or auth_config.get('api_key', "")
-                        api_secret = api_secret or auth_config.get('private_key', "") or auth_config.get('api_secret', "")
-                        wallet_address = wallet_address or auth_config.get('wallet_address', "")
-
-                    if api_key and api_secret:
-                        self.logger.info(f"从配置文件读取API密钥: {exchange_config_path}")
+                    exchange_config_data = _load_config_cached(exchange_config_path)
+                    api_config = exchange_config_data.get('api_config', {})
+
+                    if not api_key or not api_secret:
+                        auth_config = exchange_config_data.get(exchange_name, {}).get('authentication', {})
+
+                        if exchange_name == "hyperliquid":
+                            api_key = api_key or auth_config.get('private_key', "")
+                            api_secret = api_secret or auth_config.get('private_key', "")
+                            wallet_address = wallet_address or auth_config.get('wallet_address', "")
+                        elif exchange_name == "lighter":
+                            auth_config = api_config.get('auth', {})
+                            api_key = api_key or auth_config.get('api_key_private_key', "")
+                            api_secret = api_secret or auth_config.get('api_key_private_key', "")
+                        else:
+                            api_key = api_key or auth_config.get('api_key', "")
+                            api_secret = api_secret or auth_config.get('private_key', "") or auth_config.get('api_secret', "")
+                            wallet_address = wallet_address or auth_config.get('wallet_address', "")
+
+                        if api_key and api_secret:
+                            self.logger.info(f"从配置文件读取API密钥: {exchange_config_path}")
             except Exception as e:
                 self.logger.warning(f"无法读取交易所配置文件: {e}")
 
+        self._exchange_secrets = (api_key, api_secret, wallet_address, api_config)
+        return self._exchange_secrets
+
+    async def create_exchange_adapter(self):
+        """创建交易所适配器（复用原脚本的逻辑，需先加载网格配置）"""
+        from core.adapters.exchanges import ExchangeFactory, ExchangeConfig
+
+        exchange_name = self._exchange_lower
+        market_type = self.detect_market_type(self._symbol_upper, exchange_name)
+
+        self.logger.info(f"市场类型: {market_type.value}")
+
+        # 读取 API 密钥
+        api_key, api_secret, wallet_address, api_config = self._resolve_credentials(exchange_name)
+
         # 创建交易所配置
-        if exchange_name == "lighter":
-            try:
-                lighter_config_path = Path("config/exchanges/lighter_config.yaml")
-                if lighter_config_path.exists():
-                    with open(lighter_config_path, 'r', encoding='utf-8') as f:
-                        lighter_config_data = yaml.safe_load(f)
-                    api_config = lighter_config_data.get('api_config', {})
-
-                    exchange_config = ExchangeConfig(
-                        exchange_id="lighter",
-                        name="Lighter",
-                        exchange_type=market_type,
-                        api_key="",
-                        api_secret="",
-                        testnet=api_config.get('testnet', False),
-                        enable_websocket=True,
-                        enable_auto_reconnect=True
-                    )
-                else:
-                    exchange_config = ExchangeConfig(
-                        exchange_id="lighter",
-                        name="Lighter",
-                        exchange_type=market_type,
-                        api_key="",
-                        api_secret="",
-                        testnet=False,
-                        enable_websocket=True,
-                        enable_auto_reconnect=True
-                    )
-            except Exception as e:
-                self.logger.warning(f"加载Lighter配置失败: {e}")
-                exchange_config = ExchangeConfig(
-                    exchange_id="lighter",
-                    name="Lighter",
-                    exchange_type=market_type,
-                    api_key="",
-                    api_secret="",
-                    testnet=False,
-                    enable_websocket=True,
-                    enable_auto_reconnect=True
-                )
-        else:
-            exchange_config = ExchangeConfig(
-                exchange_id=exchange_name,
-                name=exchange_name.capitalize(),
-                exchange_type=market_type,
-                api_key=api_key or "",
-                api_secret=api_secret or "",
-                wallet_address=wallet_address,
-                testnet=False,
-                enable_websocket=True,
-                enable_auto_reconnect=True
-            )
+        # Lighter 的密钥由适配器自行从 lighter_config.yaml 读取，这里只传 testnet
+        is_lighter = exchange_name == "lighter"
+        if is_lighter:
+            api_key = api_secret = ""
+            wallet_address = None
+
+        exchange_config = ExchangeConfig(
+            exchange_id=exchange_name,
+            name=exchange_name.capitalize(),
+            exchange_type=market_type,
+            api_key=api_key or "",
+            api_secret=api_secret or "",
+            wallet_address=wallet_address,
+            testnet=api_config.get('testnet', False) if is_lighter else False,
+            enable_websocket=True,
+            enable_auto_reconnect=True
+        )
 
         # 使用工厂创建适配器
         factory = ExchangeFactory()
@@ -333,80 +344,121 @@ class DaemonGridRunner:
 
     async def print_statistics(self):
         """定期输出统计信息"""
-        while self._running:
+        last_total_filled = -1
+        last_price = None
+
+        while not self._shutdown_event.is_set():
             try:
-                await asyncio.sleep(self.stats_interval)
-                
+                # 等待统计间隔；收到退出信号时立即返回
+                try:
+                    await asyncio.wait_for(self._shutdown_event.wait(), timeout=self.stats_interval)
+                    return
+                except asyncio.TimeoutError:
+                    pass
+
                 if not self.coordinator:
                     continue
-                    
+
                 stats = self.coordinator.get_statistics()
                 grid_state = self.coordinator.grid_state
-                
-                self.logger.info("=" * 80)
-                self.logger.info(f"网格交易统计 - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-                self.logger.info("=" * 80)
-                self.logger.info(f"交易对: {self.coordinator.config.symbol}")
-                self.logger.info(f"网格类型: {self.coordinator.config.grid_type.value}")
-                self.logger.info(f"运行时长: {stats.uptime}")
-                self.logger.info("")
-                
-                # 持仓信息
-                self.logger.info(f"当前持仓: {grid_state.current_position}")
-                self.logger.info(f"持仓成本: ${grid_state.average_price:.4f}")
-                self.logger.info(f"当前价格: ${grid_state.current_price:.4f}")
-                self.logger.info("")
-                
-                # 订单统计
-                self.logger.info(f"活跃订单: {stats.active_orders}个")
-                self.logger.info(f"累计成交: {stats.total_filled}单")
-                self.logger.info(f"成交金额: ${stats.total_volume:.2f}")
-                self.logger.info("")
-                
-                # 盈亏统计
-                self.logger.info(f"已实现盈亏: ${stats.realized_pnl:.4f}")
-                self.logger.info(f"未实现盈亏: ${stats.unrealized_pnl:.4f}")
-                self.logger.info(f"总盈亏: ${stats.total_pnl:.4f}")
-                self.logger.info(f"盈亏率: {stats.pnl_percentage:.2f}%")
-                self.logger.info(f"年化收益率: {stats.apr:.2f}%")
-                self.logger.info("=" * 80)
-                
+
+                # 无新成交且价格未变化时跳过本次输出
+                if stats.total_filled == last_total_filled and grid_state.current_price == last_price:
+                    continue
+                last_total_filled = stats.total_filled
+                last_price = grid_state.current_price
+
+                # INFO 未启用时跳过统计文本的构建
+                if not self.logger.logger.isEnabledFor(logging.INFO):
+                    continue
+
+                lines = [
+                    self._SEP,
+                    f"网格交易统计 - {time.strftime('%Y-%m-%d %H:%M:%S')}",
+                    self._SEP,
+                    f"交易对: {self.coordinator.config.symbol}",
+                    f"网格类型: {self.coordinator.config.grid_type.value}",
+                    f"运行时长: {stats.uptime}",
+                    "",
+                    # 持仓信息
+                    f"当前持仓: {grid_state.current_position}",
+                    f"持仓成本: ${grid_state.average_price:.4f}",
+                    f"当前价格: ${grid_state.current_price:.4f}",
+                    "",
+                    # 订单统计
+                    f"活跃订单: {stats.active_orders}个",
+                    f"累计成交: {stats.total_filled}单",
+                    f"成交金额: ${stats.total_volume:.2f}",
+                    "",
+                    # 盈亏统计
+                    f"已实现盈亏: ${stats.realized_pnl:.4f}",
+                    f"未实现盈亏: ${stats.unrealized_pnl:.4f}",
+                    f"总盈亏: ${stats.total_pnl:.4f}",
+                    f"盈亏率: {stats.pnl_percentage:.2f}%",
+                    f"年化收益率: {stats.apr:.2f}%",
+                    self._SEP,
+                ]
+                # 合并为一条日志记录输出，减少 handler 调用次数
+                # （SystemLogger.info 不接受格式化参数，且无参数时不会做 % 格式化）
+                self.logger.info("\n".join(lines))
+
             except Exception as e:
                 self.logger.error(f"输出统计信息失败: {e}")
 
     async def run(self):
         """启动后台运行"""
+        from core.adapters.exchanges.utils import setup_optimized_logging
+        from core.adapters.exchanges.models import ExchangeType
+        from core.services.grid.coordinator import GridCoordinator
+        from core.services.grid.implementations import (
+            GridStrategyImpl,
+            GridEngineImpl,
+            PositionTrackerImpl
+        )
+        from core.services.grid.models import GridState
+        from core.services.grid.reserve import (
+            SpotReserveManager,
+            ReserveMonitor,
+            check_spot_reserve_on_startup
+        )
+
+        # 在运行中的事件循环内创建退出事件（先于 _loop 赋值，_loop 存在即事件可用）
+        self._shutdown_event = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+
         # 配置日志
         setup_optimized_logging(use_colored=False)  # 后台模式不使用颜色
         
         if self.debug:
-            logging.getLogger().setLevel(logging.DEBUG)
+            # 仅对本系统模块开启 DEBUG，避免第三方库（websockets 等）产生大量 DEBUG 记录
             for module in ['core.services.grid', 'core.adapters.exchanges', 'ExchangeAdapter']:
                 logging.getLogger(module).setLevel(logging.DEBUG)
 
-        self.logger.info("=" * 80)
-        self.logger.info("网格交易系统 - 后台运行模式")
-        self.logger.info("=" * 80)
+        self._log_banner("网格交易系统 - 后台运行模式")
         
         try:
             # 1. 加载配置
             self.logger.info("步骤 1/6: 加载配置文件...")
             config_data = await self.load_config()
             grid_config = self.create_grid_config(config_data)
-            self.logger.info(f"✅ 配置加载成功")
-            self.logger.info(f"   - 交易所: {grid_config.exchange}")
-            self.logger.info(f"   - 交易对: {grid_config.symbol}")
-            self.logger.info(f"   - 网格类型: {grid_config.grid_type.value}")
+            self.logger.info(
+                f"✅ 配置加载成功\n"
+                f"   - 交易所: {grid_config.exchange}\n"
+                f"   - 交易对: {grid_config.symbol}\n"
+                f"   - 网格类型: {grid_config.grid_type.value}"
+            )
+
+            # 统一大小写，后续校验与适配器创建复用
+            self._symbol_upper = grid_config.symbol.upper()
+            self._exchange_lower = grid_config.exchange.lower()
 
             # 现货做空校验
-            symbol = grid_config.symbol
-            exchange_name = grid_config.exchange.lower()
             is_spot = False
 
-            if exchange_name == "hyperliquid":
-                is_spot = ":SPOT" in symbol.upper()
-            elif exchange_name == "backpack":
-                is_spot = "_SPOT" in symbol.upper() or "SPOT" in symbol.upper()
+            if self._exchange_lower == "hyperliquid":
+                is_spot = ":SPOT" in self._symbol_upper
+            elif self._exchange_lower == "backpack":
+                is_spot = any(s in self._symbol_upper for s in _BP_SPOT_TOKENS)
 
             if is_spot and grid_config.grid_type.value in ["short", "martingale_short", "follow_short"]:
                 self.logger.error("❌ 错误：现货市场不支持做空网格！")
@@ -414,7 +466,7 @@ class DaemonGridRunner:
 
             # 2. 创建交易所适配器
             self.logger.info("步骤 2/6: 连接交易所...")
-            self.exchange_adapter = await self.create_exchange_adapter(config_data)
+            self.exchange_adapter = await self.create_exchange_adapter()
             self.logger.info(f"✅ 交易所连接成功: {grid_config.exchange}")
 
             # 3. 创建核心组件
@@ -477,26 +529,21 @@ class DaemonGridRunner:
 
             # 6. 启动统计输出任务
             self.logger.info("步骤 6/6: 启动监控任务...")
-            self._running = True
             stats_task = asyncio.create_task(self.print_statistics())
             
-            self.logger.info("=" * 80)
-            self.logger.info("✅ 网格交易系统完全启动（后台模式）")
-            self.logger.info("=" * 80)
-            self.logger.info(f"日志文件: logs/ExchangeAdapter.log")
-            self.logger.info(f"统计输出间隔: {self.stats_interval}秒")
-            self.logger.info(f"使用 'kill -SIGTERM {os.getpid()}' 或 Ctrl+C 安全退出")
-            self.logger.info("=" * 80)
+            self._log_banner(
+                "✅ 网格交易系统完全启动（后台模式）",
+                self._SEP,
+                "日志文件: logs/ExchangeAdapter.log",
+                f"统计输出间隔: {self.stats_interval}秒",
+                f"使用 'kill -SIGTERM {os.getpid()}' 或 Ctrl+C 安全退出"
+            )
 
             # 等待退出信号
             await self._shutdown_event.wait()
             
-            # 取消统计任务
-            stats_task.cancel()
-            try:
-                await stats_task
-            except asyncio.CancelledError:
-                pass
+            # 统计任务在退出事件触发后自行结束
+            await stats_task
 
         except Exception as e:
             self.logger.error(f"❌ 系统错误: {e}", exc_info=True)
@@ -508,7 +555,6 @@ class DaemonGridRunner:
     async def cleanup(self):
         """清理资源"""
         self.logger.info("正在清理资源...")
-        self._running = False
         
         try:
             if self.coordinator:
@@ -529,17 +575,24 @@ class DaemonGridRunner:
                 await self.exchange_adapter.disconnect()
                 self.logger.info("✓ 交易所已断开")
 
-            self.logger.info("=" * 80)
-            self.logger.info("✅ 系统已安全退出")
-            self.logger.info("=" * 80)
+            self._log_banner("✅ 系统已安全退出")
 
         except Exception as e:
             self.logger.error(f"⚠️ 清理过程出错: {e}")
 
-    def handle_signal(self, signum, frame):
-        """处理退出信号"""
+    def handle_signal(self, signum):
+        """处理退出信号（由事件循环回调）"""
         self.logger.info(f"\n收到退出信号 (信号: {signum})，正在安全退出...")
-        self._shutdown_event.set()
+        if self._shutdown_event is not None:
+            self._shutdown_event.set()
+
+    def handle_signal_threadsafe(self, signum, frame):
+        """signal.signal 回调（add_signal_handler 不可用时），转交事件循环线程处理"""
+        if self._loop:
+            self._loop.call_soon_threadsafe(self.handle_signal, signum)
+        else:
+            # run() 尚未启动，没有需要清理的资源，按 Ctrl+C 直接退出
+            raise KeyboardInterrupt
 
 
 def parse_arguments():
@@ -579,7 +632,7 @@ def parse_arguments():
     parser.add_argument(
         'config',
         type=str,
-        help='网格配置文件路径'
+        help='网格配置文件路径（YAML，或结构相同的 JSON）'
     )
 
     parser.add_argument(
@@ -608,24 +661,37 @@ async def main():
     """主函数"""
     args = parse_arguments()
     
-    # 检查配置文件
-    if not Path(args.config).exists():
-        print(f"❌ 配置文件不存在: {args.config}")
+    # 检查配置文件（目录等非普通文件同样拒绝）
+    if not Path(args.config).is_file():
+        print(f"❌ 配置文件不存在或不是文件: {args.config}")
         sys.exit(1)
     
     # 创建运行器
     runner = DaemonGridRunner(args.config, args.debug)
     runner.stats_interval = args.stats_interval
     
-    # 注册信号处理
-    signal.signal(signal.SIGTERM, runner.handle_signal)
-    signal.signal(signal.SIGINT, runner.handle_signal)
+    # 注册信号处理（在事件循环内回调，仅 Unix 支持）
+    loop = asyncio.get_running_loop()
+    try:
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, runner.handle_signal, sig)
+    except NotImplementedError:
+        # Windows 不支持 add_signal_handler，回退到 signal.signal
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(sig, runner.handle_signal_threadsafe)
     
     # 运行
     await runner.run()
 
 
 if __name__ == "__main__":
+    # 可选：使用 uvloop 事件循环（pip install uvloop，不支持 Windows）
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     try:
         asyncio.run(main())
     except KeyboardInterrupt: